@@ -0,0 +1,101 @@
+"""Compare feature store backends.
+
+Usage:
+    PYTHONPATH=src python benchmarks/feature_store.py --events 200000 --customers 10000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import random
+import time
+from typing import List
+
+from anti_fraud.features import (
+    FeatureStore,
+    InMemoryFeatureStore,
+    SharedMemoryFeatureStore,
+)
+from anti_fraud.models.transaction import Transaction
+
+
+def make_events(count: int, customers: int, seed: int) -> List[Transaction]:
+    rng = random.Random(seed)
+    return [
+        Transaction(
+            customer_id=f"CUST_{rng.randrange(customers)}",
+            amount=round(rng.uniform(1.0, 5000.0), 2),
+            country="USA",
+            city="New York",
+        )
+        for _ in range(count)
+    ]
+
+
+def run_updates(store: FeatureStore, events: List[Transaction]) -> float:
+    started = time.perf_counter()
+    for transaction in events:
+        store.update(transaction)
+    return time.perf_counter() - started
+
+
+def run_reads(store: FeatureStore, events: List[Transaction]) -> float:
+    started = time.perf_counter()
+    for transaction in events:
+        store.lookup(transaction)
+    return time.perf_counter() - started
+
+
+def _worker(store: SharedMemoryFeatureStore, events: List[Transaction]) -> None:
+    for transaction in events:
+        store.update(transaction)
+        store.lookup(transaction)
+    store.close()
+
+
+def run_workers(store: SharedMemoryFeatureStore, events: List[Transaction], workers: int) -> float:
+    ctx = multiprocessing.get_context()
+    processes = [
+        ctx.Process(target=_worker, args=(store, events[index::workers]))
+        for index in range(workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - started
+
+
+def report(label: str, events: int, elapsed: float) -> None:
+    print(f"{label:<34} {events / elapsed:>12,.0f} ops/s  ({elapsed * 1e6 / events:.2f} us/op)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--customers", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--stripes", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    events = make_events(args.events, args.customers, args.seed)
+    capacity = args.customers * 2
+
+    memory = InMemoryFeatureStore()
+    report("memory update", len(events), run_updates(memory, events))
+    report("memory read", len(events), run_reads(memory, events))
+
+    with SharedMemoryFeatureStore(capacity=capacity, stripes=args.stripes) as shared:
+        report("shared update", len(events), run_updates(shared, events))
+        report("shared read", len(events), run_reads(shared, events))
+
+    with SharedMemoryFeatureStore(capacity=capacity, stripes=args.stripes) as shared:
+        elapsed = run_workers(shared, events, args.workers)
+        report(f"shared update+read x{args.workers} procs", len(events) * 2, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Optional, Protocol, TypeVar
+
+
+class VersionedConfig(Protocol):
+    @property
+    def version(self) -> str: ...
+
+
+ConfigT = TypeVar("ConfigT", bound=VersionedConfig)
+
+
+class ConfigHandle(Generic[ConfigT]):
+    # Agents read `current` once per transaction and use that snapshot until
+    # they return, so a swap never lands in the middle of scoring. Snapshots are
+    # immutable and fully built (derived indexes included) before they are
+    # published; publishing is a single reference assignment.
+
+    def __init__(self, config: ConfigT) -> None:
+        self._current = config
+        # bumped by explicit swaps only, so a reload can tell it was overtaken
+        self._swap_count = 0
+        self._swap_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def current(self) -> ConfigT:
+        return self._current
+
+    @property
+    def version(self) -> str:
+        return self._current.version
+
+    def swap(self, config: ConfigT) -> ConfigT:
+        with self._swap_lock:
+            previous = self._current
+            self._current = config
+            self._swap_count += 1
+        return previous
+
+    def reload(self, build: Callable[[], ConfigT]) -> Future[ConfigT]:
+        # build runs off the scoring path; the old snapshot keeps serving until
+        # it finishes, and a failed build leaves it in place. Reloads apply in
+        # submission order; if swap() is called while one is pending, the built
+        # snapshot is discarded and the future resolves to the swapped-in one.
+        with self._swap_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-reload")
+            executor = self._executor
+            swap_count = self._swap_count
+        return executor.submit(self._build_and_swap, build, swap_count)
+
+    def close(self) -> None:
+        with self._swap_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _build_and_swap(self, build: Callable[[], ConfigT], swap_count: int) -> ConfigT:
+        config = build()
+        with self._swap_lock:
+            if self._swap_count != swap_count:
+                return self._current
+            self._current = config
+        return config
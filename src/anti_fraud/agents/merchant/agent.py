@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List, Optional, Union
 
 from anti_fraud.agents.base import BaseAgent
+from anti_fraud.agents.config_handle import ConfigHandle
 from anti_fraud.agents.merchant.config import (
-    CATEGORY_AMOUNT_THRESHOLDS,
-    CATEGORY_SYNONYMS,
-    HIGH_AMOUNT_THRESHOLD,
-    OFFLINE_CHANNELS,
-    ONLINE_CHANNELS,
-    SUSPICIOUS_MERCHANT_NAMES,
+    DEFAULT_CONFIG,
+    MerchantConfig,
+    load_config,
 )
 from anti_fraud.agents.merchant.rules import (
     MerchantRule,
@@ -23,14 +23,31 @@ from anti_fraud.models.transaction import Transaction
 class MerchantAgent(BaseAgent):
     name = "MerchantAgent"
 
-    def __init__(self, rules: Optional[List[MerchantRule]] = None) -> None:
+    def __init__(
+        self,
+        rules: Optional[List[MerchantRule]] = None,
+        config: Union[MerchantConfig, ConfigHandle[MerchantConfig], None] = None,
+    ) -> None:
         self._ruleset = rules or default_rules()
+        if isinstance(config, ConfigHandle):
+            self._config = config
+        else:
+            self._config = ConfigHandle(config or DEFAULT_CONFIG)
+
+    @property
+    def config(self) -> ConfigHandle[MerchantConfig]:
+        return self._config
+
+    def reload_config(self, path: Union[str, Path]) -> Future[MerchantConfig]:
+        return self._config.reload(lambda: load_config(path))
 
     def analyze(self, transaction: Transaction) -> AgentResult:
         reasons: List[str] = []
         features_used: List[str] = []
         score = 0.0
-        ctx = self._build_context(transaction)
+        # one snapshot per transaction: a concurrent swap applies to the next one
+        config = self._config.current
+        ctx = self._build_context(transaction, config)
         for rule in self._rules():
             result = rule.apply(transaction, ctx)
             if result.score_delta:
@@ -55,38 +72,23 @@ class MerchantAgent(BaseAgent):
             explanation=explanation,
             features_used=sorted(set(features_used)),
             reasons=reasons,
+            config_version=config.version,
         )
 
     @staticmethod
-    def _normalize_category(category: str) -> str:
-        if not category:
-            return ""
-        return CATEGORY_SYNONYMS.get(category, category)
-
-    @staticmethod
-    def _high_amount_threshold(category: str) -> float:
-        if category:
-            return CATEGORY_AMOUNT_THRESHOLDS.get(category, HIGH_AMOUNT_THRESHOLD)
-        return HIGH_AMOUNT_THRESHOLD
-
-    @staticmethod
-    def _is_suspicious_name(merchant_name: str) -> bool:
-        if merchant_name in SUSPICIOUS_MERCHANT_NAMES:
+    def _is_suspicious_name(merchant_name: str, config: MerchantConfig) -> bool:
+        if merchant_name in config.suspicious_merchant_names:
             return True
         compact = merchant_name.replace(" ", "")
-        if compact.isdigit():
-            return True
-        if merchant_name in {"n/a", "na", "none"}:
-            return True
-        return False
+        return compact.isdigit()
 
     @staticmethod
-    def _is_online(transaction: Transaction) -> Optional[bool]:
+    def _is_online(transaction: Transaction, config: MerchantConfig) -> Optional[bool]:
         channel = (transaction.channel or "").strip().lower()
         if channel:
-            if channel in ONLINE_CHANNELS:
+            if channel in config.online_channels:
                 return True
-            if channel in OFFLINE_CHANNELS:
+            if channel in config.offline_channels:
                 return False
         merchant_type = (transaction.merchant_type or "").strip().lower()
         if merchant_type == "online":
@@ -95,16 +97,19 @@ class MerchantAgent(BaseAgent):
             return True
         return None
 
-    def _build_context(self, transaction: Transaction) -> MerchantRuleContext:
+    def _build_context(self, transaction: Transaction, config: MerchantConfig) -> MerchantRuleContext:
         category_raw = (transaction.merchant_category or "").strip().lower()
-        category = self._normalize_category(category_raw)
+        category, high_amount_threshold = config.resolve_category(category_raw)
         merchant_name = (transaction.merchant or "").strip().lower()
         return MerchantRuleContext(
             category=category,
-            is_online=self._is_online(transaction),
+            is_online=self._is_online(transaction, config),
             merchant_name=merchant_name,
-            high_amount_threshold=self._high_amount_threshold(category),
-            suspicious_name=self._is_suspicious_name(merchant_name) if merchant_name else False,
+            high_amount_threshold=high_amount_threshold,
+            suspicious_name=(
+                self._is_suspicious_name(merchant_name, config) if merchant_name else False
+            ),
+            config=config,
         )
 
     def _rules(self) -> List[MerchantRule]:
@@ -1,3 +1,13 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Tuple, Union
+
 HIGH_RISK_CATEGORIES = {
     "gambling",
     "crypto",
@@ -30,6 +40,9 @@ SUSPICIOUS_MERCHANT_NAMES = {
     "misc",
     "generic",
     "test merchant",
+    "n/a",
+    "na",
+    "none",
 }
 
 HIGH_AMOUNT_THRESHOLD = 200000.0
@@ -50,3 +63,130 @@ ONLINE_CHANNELS = {
 OFFLINE_CHANNELS = {
     "pos",
 }
+
+DEFAULT_CONFIG_VERSION = "builtin"
+
+SET_FIELDS = (
+    "high_risk_categories",
+    "suspicious_merchant_names",
+    "online_channels",
+    "offline_channels",
+)
+MAPPING_FIELDS = (
+    "category_synonyms",
+    "category_amount_thresholds",
+)
+
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+
+@dataclass(frozen=True)
+class MerchantConfig:
+    version: str = DEFAULT_CONFIG_VERSION
+    high_risk_categories: FrozenSet[str] = frozenset(HIGH_RISK_CATEGORIES)
+    category_synonyms: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType(dict(CATEGORY_SYNONYMS))
+    )
+    category_amount_thresholds: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType(dict(CATEGORY_AMOUNT_THRESHOLDS))
+    )
+    suspicious_merchant_names: FrozenSet[str] = frozenset(SUSPICIOUS_MERCHANT_NAMES)
+    high_amount_threshold: float = HIGH_AMOUNT_THRESHOLD
+    risk_score_high: float = RISK_SCORE_HIGH
+    risk_score_medium: float = RISK_SCORE_MEDIUM
+    boost_high_risk_category: float = BOOST_HIGH_RISK_CATEGORY
+    boost_online_high_amount: float = BOOST_ONLINE_HIGH_AMOUNT
+    boost_suspicious_name: float = BOOST_SUSPICIOUS_NAME
+    boost_high_risk_merchant_flag: float = BOOST_HIGH_RISK_MERCHANT_FLAG
+    online_channels: FrozenSet[str] = frozenset(ONLINE_CHANNELS)
+    offline_channels: FrozenSet[str] = frozenset(OFFLINE_CHANNELS)
+
+    # derived lookup tables, rebuilt with every snapshot so readers never see
+    # a half-updated index: raw category -> (normalized category, amount threshold)
+    category_index: Mapping[str, Tuple[str, float]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # copy caller-owned collections so the snapshot and its index cannot drift
+        for name in SET_FIELDS:
+            object.__setattr__(self, name, frozenset(getattr(self, name)))
+        for name in MAPPING_FIELDS:
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+        index: Dict[str, Tuple[str, float]] = {}
+        for category, threshold in self.category_amount_thresholds.items():
+            index[category] = (category, threshold)
+        for raw, category in self.category_synonyms.items():
+            threshold = self.category_amount_thresholds.get(category, self.high_amount_threshold)
+            index[raw] = (category, threshold)
+        object.__setattr__(self, "category_index", MappingProxyType(index))
+
+    def resolve_category(self, category: str) -> Tuple[str, float]:
+        if not category:
+            return "", self.high_amount_threshold
+        return self.category_index.get(category, (category, self.high_amount_threshold))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> MerchantConfig:
+        known = {item.name: item for item in fields(cls) if item.init}
+        unknown = set(data) - set(known)
+        if unknown:
+            raise ValueError(f"Unknown merchant config keys: {', '.join(sorted(unknown))}")
+        # a bad file must fail here, before anything is published
+        values = {key: _convert(key, value) for key, value in data.items()}
+        return cls(**values)
+
+
+def _require_str(key: str, value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Merchant config key {key!r} must contain strings, got {value!r}")
+    return value
+
+
+def _require_number(key: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Merchant config key {key!r} must be a number, got {value!r}")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"Merchant config key {key!r} must be finite, got {value!r}")
+    return number
+
+
+def _convert(key: str, value: Any) -> Any:
+    if key in SET_FIELDS:
+        if not isinstance(value, list):
+            raise ValueError(f"Merchant config key {key!r} must be a list")
+        return frozenset(_normalize(_require_str(key, item)) for item in value)
+    if key in MAPPING_FIELDS:
+        if not isinstance(value, dict):
+            raise ValueError(f"Merchant config key {key!r} must be an object")
+        if key == "category_amount_thresholds":
+            return MappingProxyType(
+                {
+                    _normalize(_require_str(key, name)): _require_number(key, item)
+                    for name, item in value.items()
+                }
+            )
+        return MappingProxyType(
+            {
+                _normalize(_require_str(key, name)): _normalize(_require_str(key, item))
+                for name, item in value.items()
+            }
+        )
+    if key == "version":
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Merchant config key 'version' must be a non-empty string, got {value!r}")
+        return value
+    return _require_number(key, value)
+
+
+DEFAULT_CONFIG = MerchantConfig()
+
+
+def load_config(path: Union[str, Path]) -> MerchantConfig:
+    raw = Path(path).read_bytes()
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"Merchant config must be a JSON object: {path}")
+    data.setdefault("version", hashlib.sha256(raw).hexdigest()[:12])
+    return MerchantConfig.from_dict(data)
@@ -3,15 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional
 
-from anti_fraud.agents.merchant.config import (
-    BOOST_HIGH_RISK_CATEGORY,
-    BOOST_HIGH_RISK_MERCHANT_FLAG,
-    BOOST_ONLINE_HIGH_AMOUNT,
-    BOOST_SUSPICIOUS_NAME,
-    HIGH_RISK_CATEGORIES,
-    RISK_SCORE_HIGH,
-    RISK_SCORE_MEDIUM,
-)
+from anti_fraud.agents.merchant.config import DEFAULT_CONFIG, MerchantConfig
 from anti_fraud.models.transaction import Transaction
 
 
@@ -22,6 +14,7 @@ class MerchantRuleContext:
     merchant_name: str
     high_amount_threshold: float
     suspicious_name: bool
+    config: MerchantConfig = DEFAULT_CONFIG
 
 
 @dataclass(frozen=True)
@@ -42,11 +35,11 @@ class MerchantRiskScoreRule(MerchantRule):
             return RuleResult(0.0, [], [])
         reasons: List[str] = []
         score_delta = float(transaction.merchant_risk_score)
-        if transaction.merchant_risk_score >= RISK_SCORE_HIGH:
+        if transaction.merchant_risk_score >= ctx.config.risk_score_high:
             reasons.append(
                 f"High merchant risk score ({transaction.merchant_risk_score:.2f})"
             )
-        elif transaction.merchant_risk_score >= RISK_SCORE_MEDIUM:
+        elif transaction.merchant_risk_score >= ctx.config.risk_score_medium:
             reasons.append(
                 f"Medium merchant risk score ({transaction.merchant_risk_score:.2f})"
             )
@@ -58,7 +51,7 @@ class HighRiskMerchantFlagRule(MerchantRule):
         if transaction.high_risk_merchant is not True:
             return RuleResult(0.0, [], [])
         return RuleResult(
-            BOOST_HIGH_RISK_MERCHANT_FLAG,
+            ctx.config.boost_high_risk_merchant_flag,
             ["High-risk merchant flag"],
             ["high_risk_merchant"],
         )
@@ -68,10 +61,10 @@ class HighRiskCategoryRule(MerchantRule):
     def apply(self, transaction: Transaction, ctx: MerchantRuleContext) -> RuleResult:
         if not ctx.category:
             return RuleResult(0.0, [], [])
-        if ctx.category not in HIGH_RISK_CATEGORIES:
+        if ctx.category not in ctx.config.high_risk_categories:
             return RuleResult(0.0, [], ["merchant_category"])
         return RuleResult(
-            BOOST_HIGH_RISK_CATEGORY,
+            ctx.config.boost_high_risk_category,
             [f"High-risk category: {transaction.merchant_category}"],
             ["merchant_category"],
         )
@@ -92,7 +85,7 @@ class OnlineHighAmountRule(MerchantRule):
             return RuleResult(0.0, [], features)
         features.append("amount")
         return RuleResult(
-            BOOST_ONLINE_HIGH_AMOUNT,
+            ctx.config.boost_online_high_amount,
             [f"Online high-amount transaction (>= {ctx.high_amount_threshold:.0f})"],
             features,
         )
@@ -105,7 +98,7 @@ class SuspiciousNameRule(MerchantRule):
         if not ctx.suspicious_name:
             return RuleResult(0.0, [], ["merchant"])
         return RuleResult(
-            BOOST_SUSPICIOUS_NAME,
+            ctx.config.boost_suspicious_name,
             [f"Suspicious merchant name: {transaction.merchant}"],
             ["merchant"],
         )
@@ -0,0 +1,10 @@
+from anti_fraud.features.base import FeatureStore, customer_key
+from anti_fraud.features.memory import InMemoryFeatureStore
+from anti_fraud.features.shared import SharedMemoryFeatureStore
+
+__all__ = [
+    "FeatureStore",
+    "InMemoryFeatureStore",
+    "SharedMemoryFeatureStore",
+    "customer_key",
+]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from anti_fraud.models.customer_features import CustomerFeatures
+from anti_fraud.models.transaction import Transaction
+
+
+def customer_key(customer_id: str) -> int:
+    # builtin hash() is salted per process, so workers would disagree on keys
+    digest = hashlib.blake2b(customer_id.encode("utf-8"), digest_size=8).digest()
+    # 0 marks an empty slot in array-backed stores
+    return int.from_bytes(digest, "little") or 1
+
+
+def accumulate(features: CustomerFeatures, transaction: Transaction) -> CustomerFeatures:
+    amount = transaction.amount
+    # NaN/inf would poison the running sums for good, so count the event only
+    if amount is None or not math.isfinite(amount):
+        amount_count = features.amount_count
+        amount_sum = features.amount_sum
+        amount_sq_sum = features.amount_sq_sum
+        amount_max = features.amount_max
+        last_amount = features.last_amount
+    else:
+        amount = float(amount)
+        amount_count = features.amount_count + 1
+        amount_sum = features.amount_sum + amount
+        amount_sq_sum = features.amount_sq_sum + amount * amount
+        amount_max = max(features.amount_max, amount) if features.amount_count else amount
+        last_amount = amount
+    return CustomerFeatures(
+        txn_count=features.txn_count + 1,
+        amount_count=amount_count,
+        amount_sum=amount_sum,
+        amount_sq_sum=amount_sq_sum,
+        amount_max=amount_max,
+        last_amount=last_amount,
+        last_timestamp=transaction.timestamp or features.last_timestamp,
+        last_country=transaction.country or features.last_country,
+        last_city=transaction.city or features.last_city,
+    )
+
+
+class FeatureStore(ABC):
+    @abstractmethod
+    def get(self, customer_id: str) -> Optional[CustomerFeatures]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, transaction: Transaction) -> Optional[CustomerFeatures]:
+        raise NotImplementedError
+
+    def lookup(self, transaction: Transaction) -> Optional[CustomerFeatures]:
+        if not transaction.customer_id:
+            return None
+        return self.get(transaction.customer_id)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from anti_fraud.features.base import FeatureStore, accumulate, customer_key
+from anti_fraud.models.customer_features import CustomerFeatures
+from anti_fraud.models.transaction import Transaction
+
+
+class InMemoryFeatureStore(FeatureStore):
+    def __init__(self) -> None:
+        self._records: Dict[int, CustomerFeatures] = {}
+
+    def get(self, customer_id: str) -> Optional[CustomerFeatures]:
+        return self._records.get(customer_key(customer_id))
+
+    def update(self, transaction: Transaction) -> Optional[CustomerFeatures]:
+        if not transaction.customer_id:
+            return None
+        key = customer_key(transaction.customer_id)
+        features = accumulate(self._records.get(key, CustomerFeatures()), transaction)
+        self._records[key] = features
+        return features
+
+    def __len__(self) -> int:
+        return len(self._records)
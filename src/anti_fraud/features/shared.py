@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import struct
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Lock as LockType
+from typing import Any, Dict, List, Optional, Tuple
+
+from anti_fraud.features.base import FeatureStore, accumulate, customer_key
+from anti_fraud.models.customer_features import CustomerFeatures
+from anti_fraud.models.transaction import Transaction
+
+TIMESTAMP_WIDTH = 32
+COUNTRY_WIDTH = 64
+CITY_WIDTH = 48
+
+# key, txn_count, amount_count, amount_sum, amount_sq_sum, amount_max,
+# last_amount (NaN when unknown), last_timestamp, last_country, last_city
+RECORD = struct.Struct(f"<Qqqdddd{TIMESTAMP_WIDTH}s{COUNTRY_WIDTH}s{CITY_WIDTH}s")
+KEY = struct.Struct("<Q")
+
+DEFAULT_CAPACITY = 1 << 16
+DEFAULT_STRIPES = 64
+
+
+def _encode(value: str, width: int) -> bytes:
+    raw = value.encode("utf-8")[:width]
+    # never leave half of a multi-byte character at the cut
+    return raw.decode("utf-8", errors="ignore").encode("utf-8")
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\x00").decode("utf-8")
+
+
+def _pack_into(buf: memoryview, offset: int, key: int, features: CustomerFeatures) -> None:
+    RECORD.pack_into(
+        buf,
+        offset,
+        key,
+        features.txn_count,
+        features.amount_count,
+        features.amount_sum,
+        features.amount_sq_sum,
+        features.amount_max,
+        math.nan if features.last_amount is None else features.last_amount,
+        _encode(features.last_timestamp, TIMESTAMP_WIDTH),
+        _encode(features.last_country, COUNTRY_WIDTH),
+        _encode(features.last_city, CITY_WIDTH),
+    )
+
+
+def _unpack_from(buf: memoryview, offset: int) -> CustomerFeatures:
+    (
+        _,
+        txn_count,
+        amount_count,
+        amount_sum,
+        amount_sq_sum,
+        amount_max,
+        last_amount,
+        last_timestamp,
+        last_country,
+        last_city,
+    ) = RECORD.unpack_from(buf, offset)
+    return CustomerFeatures(
+        txn_count=txn_count,
+        amount_count=amount_count,
+        amount_sum=amount_sum,
+        amount_sq_sum=amount_sq_sum,
+        amount_max=amount_max,
+        last_amount=None if math.isnan(last_amount) else last_amount,
+        last_timestamp=_decode(last_timestamp),
+        last_country=_decode(last_country),
+        last_city=_decode(last_city),
+    )
+
+
+class SharedMemoryFeatureStore(FeatureStore):
+    # The table is split into `stripes` contiguous segments, each guarded by its
+    # own lock; a key always lives in the segment picked by `key % stripes` and
+    # is placed there with linear probing, so a single lock covers every slot a
+    # lookup or insert may touch. Pass the store to child processes at creation
+    # time (Process args / fork) - the locks are inherited, not attached by name.
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        stripes: int = DEFAULT_STRIPES,
+        name: Optional[str] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        if capacity <= 0 or stripes <= 0:
+            raise ValueError("capacity and stripes must be positive")
+        self._stripes = stripes
+        self._slots_per_stripe = -(-capacity // stripes)
+        size = RECORD.size * self._slots_per_stripe * stripes
+        self._shm = SharedMemory(name=name, create=True, size=size)
+        self._buffer()[:size] = bytes(size)
+        ctx = mp_context or multiprocessing.get_context()
+        self._locks: List[LockType] = [ctx.Lock() for _ in range(stripes)]
+        self._owner = True
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._slots_per_stripe * self._stripes
+
+    def get(self, customer_id: str) -> Optional[CustomerFeatures]:
+        key = customer_key(customer_id)
+        stripe, start = self._position(key)
+        with self._locks[stripe]:
+            offset, found = self._find(key, stripe, start)
+            if not found:
+                return None
+            return _unpack_from(self._buffer(), offset)
+
+    def update(self, transaction: Transaction) -> Optional[CustomerFeatures]:
+        if not transaction.customer_id:
+            return None
+        key = customer_key(transaction.customer_id)
+        stripe, start = self._position(key)
+        with self._locks[stripe]:
+            offset, found = self._find(key, stripe, start)
+            if offset < 0:
+                raise RuntimeError(f"Feature store stripe {stripe} is full")
+            buf = self._buffer()
+            current = _unpack_from(buf, offset) if found else CustomerFeatures()
+            features = accumulate(current, transaction)
+            _pack_into(buf, offset, key, features)
+            # hand back what was stored, fixed-width strings included
+            return _unpack_from(buf, offset)
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> SharedMemoryFeatureStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+        self.unlink()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "name": self._shm.name,
+            "stripes": self._stripes,
+            "slots_per_stripe": self._slots_per_stripe,
+            "locks": self._locks,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._stripes = state["stripes"]
+        self._slots_per_stripe = state["slots_per_stripe"]
+        self._shm = SharedMemory(name=state["name"])
+        self._locks = state["locks"]
+        self._owner = False
+
+    def _buffer(self) -> memoryview:
+        buf = self._shm.buf
+        if buf is None:
+            raise ValueError("Feature store is closed")
+        return buf
+
+    def _position(self, key: int) -> Tuple[int, int]:
+        return key % self._stripes, (key // self._stripes) % self._slots_per_stripe
+
+    def _find(self, key: int, stripe: int, start: int) -> Tuple[int, bool]:
+        base = stripe * self._slots_per_stripe
+        buf = self._buffer()
+        for probe in range(self._slots_per_stripe):
+            slot = base + (start + probe) % self._slots_per_stripe
+            offset = slot * RECORD.size
+            (stored,) = KEY.unpack_from(buf, offset)
+            if stored == key:
+                return offset, True
+            if stored == 0:
+                return offset, False
+        return -1, False
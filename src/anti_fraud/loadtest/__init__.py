@@ -0,0 +1,12 @@
+from anti_fraud.loadtest.histogram import LatencyHistogram
+from anti_fraud.loadtest.runner import LoadResult, run_open_loop, sweep
+from anti_fraud.loadtest.sources import load_transactions, synthetic_transactions
+
+__all__ = [
+    "LatencyHistogram",
+    "LoadResult",
+    "load_transactions",
+    "run_open_loop",
+    "sweep",
+    "synthetic_transactions",
+]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+from typing import Callable, Dict, Iterable, List, Optional
+
+from anti_fraud.agents.base import BaseAgent
+from anti_fraud.agents.merchant.agent import MerchantAgent
+from anti_fraud.loadtest.histogram import LatencyHistogram
+from anti_fraud.loadtest.runner import ARRIVALS, LoadResult, sweep
+from anti_fraud.loadtest.sources import load_transactions, synthetic_transactions
+from anti_fraud.models.transaction import Transaction
+
+AGENTS: Dict[str, Callable[[], BaseAgent]] = {
+    "merchant": MerchantAgent,
+}
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+
+def _ms(value_ns: int) -> str:
+    return f"{value_ns / 1e6:.3f}"
+
+
+def format_percentiles(label: str, histogram: LatencyHistogram) -> List[str]:
+    lines = [f"{label} (ms), {histogram.total_count} samples, mean {histogram.mean / 1e6:.3f}"]
+    for percentile in PERCENTILES:
+        lines.append(f"  p{percentile:<6g} {_ms(histogram.value_at_percentile(percentile)):>10}")
+    lines.append(f"  max     {_ms(histogram.max):>10}")
+    return lines
+
+
+def format_saturation(results: List[LoadResult], slo_p99_ms: Optional[float]) -> List[str]:
+    lines = [
+        f"{'target/s':>10} {'achieved/s':>11} {'p50 ms':>9} {'p99 ms':>9} {'p999 ms':>9} "
+        f"{'max ms':>9} {'svc p99':>9}  ok"
+    ]
+    for result in results:
+        latency = result.latency
+        lines.append(
+            f"{result.target_rate:>10.0f} {result.achieved_rate:>11.0f} "
+            f"{_ms(latency.value_at_percentile(50.0)):>9} "
+            f"{_ms(latency.value_at_percentile(99.0)):>9} "
+            f"{_ms(latency.value_at_percentile(99.9)):>9} "
+            f"{_ms(latency.max):>9} "
+            f"{_ms(result.service_time.value_at_percentile(99.0)):>9}  "
+            f"{'yes' if result.is_sustainable(slo_p99_ms) else 'no'}"
+        )
+    sustainable = [result.target_rate for result in results if result.is_sustainable(slo_p99_ms)]
+    if sustainable:
+        lines.append(f"Max sustainable rate: {max(sustainable):.0f} events/s")
+    else:
+        lines.append("No sustainable rate in the tested range")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m anti_fraud.loadtest",
+        description="Open-loop load test of an agent with coordinated-omission-corrected latency.",
+    )
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="merchant")
+    parser.add_argument("--dataset", help="CSV with transactions (synthetic_fraud_data.csv format)")
+    parser.add_argument("--limit", type=int, help="Max rows to read from the dataset")
+    parser.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        default=[1000.0, 5000.0, 10000.0, 20000.0],
+        help="Target arrival rates (events/s); several rates produce a saturation curve",
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per rate")
+    parser.add_argument("--warmup", type=int, default=1000, help="Events processed before measuring")
+    parser.add_argument("--arrival", choices=ARRIVALS, default="uniform")
+    parser.add_argument("--slo-p99-ms", type=float, help="p99 latency budget for the sustainable rate")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    agent = AGENTS[args.agent]()
+    if args.dataset:
+        try:
+            dataset = load_transactions(args.dataset, args.limit)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if not dataset:
+            parser.error(f"No transactions in {args.dataset}")
+
+        def transactions() -> Iterable[Transaction]:
+            return itertools.cycle(dataset)
+    else:
+
+        def transactions() -> Iterable[Transaction]:
+            return synthetic_transactions(args.seed)
+
+    results = sweep(
+        agent.analyze,
+        transactions,
+        args.rates,
+        args.duration,
+        warmup=args.warmup,
+        arrival=args.arrival,
+        seed=args.seed,
+    )
+    for result in results:
+        print(f"== {agent.name} @ {result.target_rate:.0f} events/s ({args.arrival})")
+        print("\n".join(format_percentiles("latency", result.latency)))
+        print("\n".join(format_percentiles("service time", result.service_time)))
+        print()
+    print("\n".join(format_saturation(results, args.slo_p99_ms)))
+
+
+if __name__ == "__main__":
+    main()
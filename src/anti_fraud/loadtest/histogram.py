@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+from typing import List
+
+
+class LatencyHistogram:
+    # HDR-style log-linear buckets: values below `sub_bucket_count` are exact,
+    # above that every power-of-two range is split into `sub_bucket_count / 2`
+    # linear sub-buckets, which keeps the relative error under
+    # 10 ** -significant_digits at constant memory regardless of the range.
+
+    def __init__(self, significant_digits: int = 3) -> None:
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_digits))
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half = self._sub_bucket_count >> 1
+        self._counts: List[int] = []
+        self.total_count = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        if value < 0:
+            raise ValueError("Histogram values must be non-negative")
+        index = self._index(value)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += count
+        if not self.total_count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.total_count += count
+        self._sum += value * count
+
+    def add(self, other: LatencyHistogram) -> None:
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.total_count:
+            return
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self.min = min(self.min, other.min) if self.total_count else other.min
+        self.max = max(self.max, other.max)
+        self.total_count += other.total_count
+        self._sum += other._sum
+
+    @property
+    def mean(self) -> float:
+        if not self.total_count:
+            return 0.0
+        return self._sum / self.total_count
+
+    def value_at_percentile(self, percentile: float) -> int:
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(self.total_count * min(percentile, 100.0) / 100.0))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self._sub_bucket_bits
+        return self._sub_bucket_count + (shift - 1) * self._sub_bucket_half + (value >> shift) - self._sub_bucket_half
+
+    def _value(self, index: int) -> int:
+        # highest value that maps to the bucket, so percentiles never under-report
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._sub_bucket_half + 1
+        sub_bucket = offset % self._sub_bucket_half + self._sub_bucket_half
+        return ((sub_bucket + 1) << shift) - 1
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import csv
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, get_args, get_type_hints
+
+from anti_fraud.models.transaction import Transaction
+
+# synthetic_fraud_data.csv column -> Transaction field, where the names differ
+CSV_COLUMN_ALIASES = {
+    "device": "device_type",
+}
+
+BOOL_VALUES = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+SYNTHETIC_CATEGORIES = [
+    "retail",
+    "grocery",
+    "restaurant",
+    "entertainment",
+    "travel",
+    "healthcare",
+    "education",
+    "gas",
+    "gambling",
+    "crypto",
+]
+SYNTHETIC_MERCHANTS = ["Amazon", "Walmart", "Local Shop", "Unknown", "12345", "Steam"]
+SYNTHETIC_CHANNELS = ["web", "mobile", "pos"]
+
+
+def _parse_bool(raw: str) -> bool:
+    try:
+        return BOOL_VALUES[raw.strip().lower()]
+    except KeyError:
+        raise ValueError(f"not a boolean: {raw!r}") from None
+
+
+def _parse_int(raw: str) -> int:
+    number = float(raw)
+    if not number.is_integer():
+        raise ValueError(f"not an integer: {raw!r}")
+    return int(number)
+
+
+_PARSERS: Dict[type, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: _parse_int,
+    float: float,
+    str: str,
+}
+
+
+def _field_parsers() -> Dict[str, Callable[[str], Any]]:
+    parsers: Dict[str, Callable[[str], Any]] = {}
+    for name, hint in get_type_hints(Transaction).items():
+        # Optional[X] / X | None -> X
+        kinds = [kind for kind in get_args(hint) if kind is not type(None)] or [hint]
+        if len(kinds) != 1 or kinds[0] not in _PARSERS:
+            raise TypeError(f"No CSV parser for Transaction.{name}: {hint}")
+        parsers[name] = _PARSERS[kinds[0]]
+    return parsers
+
+
+_FIELD_PARSERS = _field_parsers()
+
+
+def row_to_transaction(row: Dict[str, str]) -> Transaction:
+    values = {}
+    for column, raw in row.items():
+        field = CSV_COLUMN_ALIASES.get(column, column)
+        if field not in _FIELD_PARSERS or raw is None or raw == "":
+            continue
+        try:
+            values[field] = _FIELD_PARSERS[field](raw)
+        except ValueError as exc:
+            raise ValueError(f"Column {column!r}: {exc}") from exc
+    return Transaction(**values)
+
+
+def load_transactions(path: Union[str, Path], limit: Optional[int] = None) -> List[Transaction]:
+    transactions: List[Transaction] = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        for row in reader:
+            if limit is not None and len(transactions) >= limit:
+                break
+            try:
+                transactions.append(row_to_transaction(row))
+            except ValueError as exc:
+                raise ValueError(f"{path}, line {reader.line_num}: {exc}") from exc
+    return transactions
+
+
+def synthetic_transactions(seed: int = 42) -> Iterator[Transaction]:
+    rng = random.Random(seed)
+    index = 0
+    while True:
+        yield Transaction(
+            transaction_id=f"TX_{index}",
+            customer_id=f"CUST_{rng.randrange(10_000)}",
+            amount=round(rng.lognormvariate(8.0, 1.5), 2),
+            card_present=rng.random() < 0.5,
+            merchant=rng.choice(SYNTHETIC_MERCHANTS),
+            merchant_category=rng.choice(SYNTHETIC_CATEGORIES),
+            merchant_risk_score=round(rng.random(), 2),
+            high_risk_merchant=rng.random() < 0.1,
+            channel=rng.choice(SYNTHETIC_CHANNELS),
+        )
+        index += 1
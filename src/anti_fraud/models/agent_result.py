@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass(frozen=True)
@@ -12,3 +12,4 @@ class AgentResult:
     explanation: str
     features_used: List[str]
     reasons: List[str]
+    config_version: Optional[str] = None
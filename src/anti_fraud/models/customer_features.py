@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CustomerFeatures:
+    txn_count: int = 0
+    amount_count: int = 0
+    amount_sum: float = 0.0
+    amount_sq_sum: float = 0.0
+    amount_max: float = 0.0
+    last_amount: Optional[float] = None
+    last_timestamp: str = ""
+    last_country: str = ""
+    last_city: str = ""
+
+    @property
+    def amount_mean(self) -> Optional[float]:
+        if not self.amount_count:
+            return None
+        return self.amount_sum / self.amount_count
+
+    @property
+    def amount_std(self) -> Optional[float]:
+        mean = self.amount_mean
+        if mean is None:
+            return None
+        variance = self.amount_sq_sum / self.amount_count - mean * mean
+        return math.sqrt(max(variance, 0.0))
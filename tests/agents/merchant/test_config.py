@@ -0,0 +1,176 @@
+import json
+
+import pytest
+
+from anti_fraud.agents.merchant.agent import MerchantAgent
+from anti_fraud.agents.merchant.config import (
+    DEFAULT_CONFIG,
+    HIGH_AMOUNT_THRESHOLD,
+    MerchantConfig,
+    load_config,
+)
+from anti_fraud.models.transaction import Transaction
+
+pytestmark = pytest.mark.unit
+
+
+def write_config(tmp_path, data, name="merchant.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestMerchantConfig:
+    @pytest.mark.parametrize(
+        "category, expected",
+        [
+            ("", ("", HIGH_AMOUNT_THRESHOLD)),
+            ("grocery", ("grocery", 176526.09)),
+            ("groceries", ("grocery", 176526.09)),
+            ("gambling", ("gambling", HIGH_AMOUNT_THRESHOLD)),
+        ],
+    )
+    def test_resolve_category(self, category, expected):
+        assert DEFAULT_CONFIG.resolve_category(category) == expected
+
+    def test_constructor_copies_caller_collections(self):
+        synonyms = {"fuel": "gas"}
+        channels = {"web"}
+        config = MerchantConfig(category_synonyms=synonyms, online_channels=channels)
+
+        synonyms["fuel"] = "x"
+        channels.add("mobile")
+
+        assert config.category_synonyms["fuel"] == "gas"
+        assert config.resolve_category("fuel") == ("gas", DEFAULT_CONFIG.category_amount_thresholds["gas"])
+        assert config.online_channels == frozenset({"web"})
+        with pytest.raises(TypeError):
+            config.category_synonyms["fuel"] = "x"
+
+    def test_from_dict_overrides_and_normalizes(self):
+        config = MerchantConfig.from_dict(
+            {
+                "version": "v2",
+                "high_risk_categories": ["Gambling", " Jewelry "],
+                "category_synonyms": {"Jewellery": "jewelry"},
+                "category_amount_thresholds": {"jewelry": 5000},
+                "boost_suspicious_name": 0.25,
+            }
+        )
+
+        assert config.version == "v2"
+        assert config.high_risk_categories == frozenset({"gambling", "jewelry"})
+        assert config.resolve_category("jewellery") == ("jewelry", 5000.0)
+        assert config.boost_suspicious_name == 0.25
+        assert config.online_channels == DEFAULT_CONFIG.online_channels
+
+    def test_from_dict_rejects_unknown_keys(self):
+        with pytest.raises(ValueError, match="high_amount"):
+            MerchantConfig.from_dict({"high_amount": 1})
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ({"online_channels": "web"}, "'online_channels' must be a list"),
+            ({"suspicious_merchant_names": {"unknown": True}}, "'suspicious_merchant_names' must be a list"),
+            ({"category_synonyms": ["fuel", "gas"]}, "'category_synonyms' must be an object"),
+            ({"category_amount_thresholds": "grocery"}, "'category_amount_thresholds' must be an object"),
+            ({"category_amount_thresholds": {"grocery": "high"}}, "'category_amount_thresholds'"),
+            ({"high_amount_threshold": None}, "'high_amount_threshold'"),
+            ({"high_amount_threshold": True}, "'high_amount_threshold' must be a number"),
+            ({"risk_score_high": float("nan")}, "'risk_score_high' must be finite"),
+            ({"category_amount_thresholds": {"grocery": False}}, "'category_amount_thresholds' must be a number"),
+            ({"category_amount_thresholds": {"grocery": float("nan")}}, "'category_amount_thresholds' must be finite"),
+            ({"high_risk_categories": [1, None]}, "'high_risk_categories' must contain strings"),
+            ({"suspicious_merchant_names": [None]}, "'suspicious_merchant_names' must contain strings"),
+            ({"category_synonyms": {"a": {"x": 1}}}, "'category_synonyms' must contain strings"),
+            ({"version": None}, "'version' must be a non-empty string"),
+            ({"version": "  "}, "'version' must be a non-empty string"),
+        ],
+    )
+    def test_from_dict_rejects_wrong_types(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            MerchantConfig.from_dict(data)
+
+    def test_load_config_versions_by_content_when_unset(self, tmp_path):
+        first = load_config(write_config(tmp_path, {"high_amount_threshold": 1000}))
+        second = load_config(write_config(tmp_path, {"high_amount_threshold": 2000}))
+
+        assert first.high_amount_threshold == 1000.0
+        assert first.version != second.version
+        assert first.version == load_config(write_config(tmp_path, {"high_amount_threshold": 1000})).version
+
+
+class TestMerchantAgentConfig:
+    def test_result_records_config_version(self):
+        result = MerchantAgent().analyze(Transaction())
+
+        assert result.config_version == DEFAULT_CONFIG.version
+
+    def test_swap_applies_to_next_transaction(self):
+        agent = MerchantAgent()
+        transaction = Transaction(merchant_category="jewelry")
+
+        before = agent.analyze(transaction)
+        agent.config.swap(MerchantConfig.from_dict({"version": "v2", "high_risk_categories": ["jewelry"]}))
+        after = agent.analyze(transaction)
+
+        assert before.score == 0.0
+        assert after.score == pytest.approx(DEFAULT_CONFIG.boost_high_risk_category)
+        assert after.reasons == ["High-risk category: jewelry"]
+        assert after.config_version == "v2"
+
+    def test_reload_config_from_file(self, tmp_path):
+        path = write_config(tmp_path, {"version": "v3", "high_amount_threshold": 1000})
+        agent = MerchantAgent()
+
+        config = agent.reload_config(path).result(timeout=5)
+        result = agent.analyze(Transaction(channel="web", amount=5000))
+        agent.config.close()
+
+        assert config.version == "v3"
+        assert result.reasons == ["Online high-amount transaction (>= 1000)"]
+        assert result.config_version == "v3"
+
+    def test_failed_reload_keeps_current_config(self, tmp_path):
+        path = write_config(tmp_path, {"no_such_key": 1})
+        agent = MerchantAgent()
+
+        future = agent.reload_config(path)
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        agent.config.close()
+
+        assert agent.config.current is DEFAULT_CONFIG
+
+    def test_reload_with_wrong_types_keeps_current_config(self, tmp_path):
+        path = write_config(tmp_path, {"version": "bad", "online_channels": "web"})
+        agent = MerchantAgent()
+
+        future = agent.reload_config(path)
+        with pytest.raises(ValueError, match="online_channels"):
+            future.result(timeout=5)
+        agent.config.close()
+
+        assert agent.config.current is DEFAULT_CONFIG
+        assert agent.analyze(Transaction(channel="web", amount=250000)).score > 0
+
+    def test_swap_replaces_suspicious_name_blocklist(self):
+        agent = MerchantAgent()
+
+        before = agent.analyze(Transaction(merchant="N/A"))
+        agent.config.swap(MerchantConfig.from_dict({"suspicious_merchant_names": ["shell co"]}))
+        after_default = agent.analyze(Transaction(merchant="N/A"))
+        after_new = agent.analyze(Transaction(merchant="Shell Co"))
+
+        assert before.reasons == ["Suspicious merchant name: N/A"]
+        assert after_default.reasons == ["No specific merchant risk signals"]
+        assert after_new.reasons == ["Suspicious merchant name: Shell Co"]
+
+    def test_agents_share_one_handle(self):
+        first = MerchantAgent()
+        second = MerchantAgent(config=first.config)
+
+        first.config.swap(MerchantConfig(version="v4"))
+
+        assert second.analyze(Transaction()).config_version == "v4"
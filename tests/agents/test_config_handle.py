@@ -0,0 +1,65 @@
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from anti_fraud.agents.config_handle import ConfigHandle
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass(frozen=True)
+class Config:
+    version: str
+
+
+def test_swap_returns_previous():
+    handle = ConfigHandle(Config("v1"))
+
+    previous = handle.swap(Config("v2"))
+
+    assert previous.version == "v1"
+    assert handle.version == "v2"
+
+
+def test_reload_publishes_built_snapshot():
+    handle = ConfigHandle(Config("v1"))
+
+    result = handle.reload(lambda: Config("v2")).result(timeout=5)
+    handle.close()
+
+    assert result.version == "v2"
+    assert handle.current is result
+
+
+def test_queued_reloads_apply_in_order():
+    handle = ConfigHandle(Config("v1"))
+
+    first = handle.reload(lambda: Config("v2"))
+    second = handle.reload(lambda: Config("v3"))
+    first.result(timeout=5)
+    second.result(timeout=5)
+    handle.close()
+
+    assert handle.version == "v3"
+
+
+def test_swap_during_reload_is_not_overwritten():
+    handle = ConfigHandle(Config("v1"))
+    building = threading.Event()
+    release = threading.Event()
+
+    def build():
+        building.set()
+        release.wait(timeout=5)
+        return Config("from-file")
+
+    future = handle.reload(build)
+    assert building.wait(timeout=5)
+    handle.swap(Config("manual"))
+    release.set()
+    result = future.result(timeout=5)
+    handle.close()
+
+    assert handle.version == "manual"
+    assert result.version == "manual"
@@ -0,0 +1,132 @@
+import multiprocessing
+
+import pytest
+
+from anti_fraud.features import (
+    InMemoryFeatureStore,
+    SharedMemoryFeatureStore,
+    customer_key,
+)
+from anti_fraud.models.transaction import Transaction
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["memory", "shared"])
+def store(request):
+    if request.param == "memory":
+        yield InMemoryFeatureStore()
+        return
+    with SharedMemoryFeatureStore(capacity=256, stripes=8) as shared:
+        yield shared
+
+
+def _hammer(store, customer_id, count):
+    for _ in range(count):
+        store.update(Transaction(customer_id=customer_id, amount=1.0))
+    store.close()
+
+
+class TestFeatureStore:
+    def test_unknown_customer(self, store):
+        assert store.get("missing") is None
+        assert store.lookup(Transaction()) is None
+
+    def test_update_without_customer_is_ignored(self, store):
+        assert store.update(Transaction(amount=10.0)) is None
+
+    def test_aggregates_spend_and_location(self, store):
+        store.update(Transaction(customer_id="c1", amount=100.0, country="USA", city="Boston"))
+        store.update(Transaction(customer_id="c1", amount=None, timestamp="2024-10-01T12:00:00"))
+        store.update(Transaction(customer_id="c1", amount=300.0, country="Germany"))
+
+        features = store.get("c1")
+
+        assert features.txn_count == 3
+        assert features.amount_count == 2
+        assert features.amount_sum == 400.0
+        assert features.amount_max == 300.0
+        assert features.last_amount == 300.0
+        assert features.amount_mean == pytest.approx(200.0)
+        assert features.amount_std == pytest.approx(100.0)
+        assert features.last_country == "Germany"
+        assert features.last_city == "Boston"
+        assert features.last_timestamp == "2024-10-01T12:00:00"
+
+    def test_update_matches_get_for_long_values(self, store):
+        long_city = "Llanfairpwllgwyngyllgogerychwyrndrobwllllantysiliogogogoch-" * 2
+
+        updated = store.update(
+            Transaction(customer_id="c1", country="United Arab Emirates", city=long_city)
+        )
+
+        assert updated == store.get("c1")
+        assert updated.last_country == "United Arab Emirates"
+        assert long_city.startswith(updated.last_city)
+
+    @pytest.mark.parametrize("amount", [float("nan"), float("inf")])
+    def test_non_finite_amount_only_counts_event(self, store, amount):
+        store.update(Transaction(customer_id="c1", amount=10.0))
+
+        updated = store.update(Transaction(customer_id="c1", amount=amount))
+
+        assert updated == store.get("c1")
+        assert updated.txn_count == 2
+        assert updated.amount_count == 1
+        assert updated.amount_sum == 10.0
+        assert updated.last_amount == 10.0
+
+    def test_customers_are_isolated(self, store):
+        store.update(Transaction(customer_id="c1", amount=1.0))
+        store.update(Transaction(customer_id="c2", amount=2.0))
+
+        assert store.lookup(Transaction(customer_id="c1")).amount_sum == 1.0
+        assert store.get("c2").amount_sum == 2.0
+
+
+class TestSharedMemoryFeatureStore:
+    def test_truncates_long_strings_on_char_boundary(self):
+        with SharedMemoryFeatureStore(capacity=8, stripes=1) as store:
+            store.update(Transaction(customer_id="c1", city="Ж" * 100))
+
+            assert store.get("c1").last_city == "Ж" * 24
+
+    def test_full_stripe_raises(self):
+        with SharedMemoryFeatureStore(capacity=2, stripes=1) as store:
+            store.update(Transaction(customer_id="c1"))
+            store.update(Transaction(customer_id="c2"))
+
+            assert store.get("c3") is None
+            with pytest.raises(RuntimeError):
+                store.update(Transaction(customer_id="c3"))
+
+    def test_closed_store_raises(self):
+        store = SharedMemoryFeatureStore(capacity=8, stripes=1)
+        store.close()
+        store.unlink()
+
+        with pytest.raises(ValueError, match="closed"):
+            store.get("c1")
+
+    @pytest.mark.integration
+    def test_updates_from_worker_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        with SharedMemoryFeatureStore(capacity=64, stripes=4, mp_context=ctx) as store:
+            workers = [
+                ctx.Process(target=_hammer, args=(store, customer_id, 200))
+                for customer_id in ("c1", "c1", "c2", "c2")
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            assert all(worker.exitcode == 0 for worker in workers)
+            assert store.get("c1").txn_count == 400
+            assert store.get("c2").amount_sum == 400.0
+
+
+def test_customer_key_is_stable_and_non_zero():
+    assert customer_key("c1") == customer_key("c1")
+    assert customer_key("c1") != customer_key("c2")
+    assert customer_key("") != 0
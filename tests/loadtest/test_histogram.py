@@ -0,0 +1,67 @@
+import pytest
+
+from anti_fraud.loadtest.histogram import LatencyHistogram
+
+pytestmark = pytest.mark.unit
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.total_count == 0
+    assert histogram.mean == 0.0
+    assert histogram.value_at_percentile(99.0) == 0
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.min == 1
+    assert histogram.max == 100
+    assert histogram.mean == pytest.approx(50.5)
+    assert histogram.value_at_percentile(50.0) == 50
+    assert histogram.value_at_percentile(99.0) == 99
+    assert histogram.value_at_percentile(100.0) == 100
+
+
+@pytest.mark.parametrize("digits", [2, 3])
+def test_large_values_within_relative_precision(digits):
+    histogram = LatencyHistogram(significant_digits=digits)
+    values = [1_234_567, 98_765_432, 3_600_000_000_000]
+    for value in values:
+        histogram.record(value)
+
+    for percentile, value in zip([33.0, 66.0, 99.0], values):
+        reported = histogram.value_at_percentile(percentile)
+        assert value <= reported <= value * (1 + 10**-digits)
+
+
+def test_tail_percentiles_follow_outliers():
+    histogram = LatencyHistogram()
+    histogram.record(1_000, count=9_990)
+    histogram.record(1_000_000, count=10)
+
+    assert histogram.value_at_percentile(99.0) == pytest.approx(1_000, rel=1e-3)
+    assert histogram.value_at_percentile(99.95) == pytest.approx(1_000_000, rel=1e-3)
+    assert histogram.max == 1_000_000
+
+
+def test_add_merges_counts_and_bounds():
+    left = LatencyHistogram()
+    right = LatencyHistogram()
+    left.record(10, count=3)
+    right.record(5_000_000)
+
+    left.add(right)
+
+    assert left.total_count == 4
+    assert left.min == 10
+    assert left.max == 5_000_000
+    assert left.value_at_percentile(100.0) == 5_000_000
+
+
+def test_rejects_negative_values():
+    with pytest.raises(ValueError):
+        LatencyHistogram().record(-1)
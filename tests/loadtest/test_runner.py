@@ -0,0 +1,114 @@
+import itertools
+import time
+
+import pytest
+
+from anti_fraud.loadtest.runner import run_open_loop, sweep
+from anti_fraud.loadtest.sources import (
+    load_transactions,
+    row_to_transaction,
+    synthetic_transactions,
+)
+from anti_fraud.models.transaction import Transaction
+
+pytestmark = pytest.mark.unit
+
+
+def test_latency_includes_queueing_behind_a_stall():
+    calls = []
+
+    def handler(transaction):
+        calls.append(transaction)
+        if len(calls) == 1:
+            time.sleep(0.05)
+
+    result = run_open_loop(handler, itertools.repeat(Transaction()), rate=1000.0, events=20)
+
+    assert result.events == 20
+    # the stall delays every event scheduled during it, not just the first one
+    assert result.latency.value_at_percentile(50.0) >= 30_000_000
+    assert result.service_time.value_at_percentile(50.0) < 5_000_000
+    assert result.latency.max >= result.service_time.max
+
+
+def test_warmup_events_are_not_measured():
+    calls = []
+
+    result = run_open_loop(
+        calls.append, itertools.repeat(Transaction()), rate=10_000.0, events=5, warmup=3
+    )
+
+    assert len(calls) == 8
+    assert result.latency.total_count == 5
+
+
+def test_sweep_runs_every_rate_with_fresh_source():
+    results = sweep(
+        lambda transaction: None,
+        lambda: synthetic_transactions(seed=1),
+        rates=[500.0, 1000.0],
+        duration_s=0.01,
+        arrival="poisson",
+    )
+
+    assert [result.target_rate for result in results] == [500.0, 1000.0]
+    assert [result.events for result in results] == [5, 10]
+    assert all(result.is_sustainable(tolerance=0.0) for result in results)
+
+
+def test_rejects_unknown_arrival():
+    with pytest.raises(ValueError):
+        run_open_loop(lambda transaction: None, [Transaction()], rate=10.0, events=1, arrival="burst")
+
+
+def test_row_to_transaction_maps_dataset_columns():
+    row = {
+        "transaction_id": "TX_1",
+        "amount": "294.87",
+        "card_present": "False",
+        "high_risk_merchant": "True",
+        "device": "Chrome",
+        "merchant_risk_score": "",
+        "is_fraud": "False",
+    }
+
+    transaction = row_to_transaction(row)
+
+    assert transaction.transaction_id == "TX_1"
+    assert transaction.amount == 294.87
+    assert transaction.card_present is False
+    assert transaction.high_risk_merchant is True
+    assert transaction.device_type == "Chrome"
+    assert transaction.merchant_risk_score is None
+
+
+def test_row_to_transaction_parses_by_field_type():
+    transaction = row_to_transaction(
+        {"account_age": "42", "fraud_protection_enabled": "no", "customer_id": "007"}
+    )
+
+    assert transaction.account_age == 42
+    assert transaction.fraud_protection_enabled is False
+    assert transaction.customer_id == "007"
+
+
+@pytest.mark.parametrize(
+    "row, column",
+    [
+        ({"amount": "abc"}, "amount"),
+        ({"card_present": "maybe"}, "card_present"),
+        ({"account_age": "1.5"}, "account_age"),
+    ],
+)
+def test_row_to_transaction_rejects_malformed_cells(row, column):
+    with pytest.raises(ValueError, match=f"Column '{column}'"):
+        row_to_transaction(row)
+
+
+def test_load_transactions_reports_line_of_malformed_row(tmp_path):
+    path = tmp_path / "transactions.csv"
+    path.write_text("transaction_id,amount\nTX_1,10.5\nTX_2,oops\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 3: Column 'amount'"):
+        load_transactions(path)
+    assert [t.amount for t in load_transactions(path, limit=1)] == [10.5]